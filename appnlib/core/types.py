@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import datetime
+from collections.abc import Mapping  # noqa: TC003  # pydantic resolves field annotations at runtime
+from functools import cached_property
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Annotated, Any, ClassVar, Protocol, Self, _SpecialForm, runtime_checkable
 
 from pydantic import (
     BaseModel,
+    ConfigDict,
     GetCoreSchemaHandler,
     GetJsonSchemaHandler,
     ValidationError,
+    field_serializer,
+    field_validator,
     model_validator,
 )
 from pydantic import (
@@ -192,11 +198,14 @@ class LinkedDataClassP(PydanticModel, Protocol):
 
 
 NodeT = IdentifiedNode | str
-FieldSetT = set[str]
+FieldSetT = frozenset[str]
+"""Immutable set of field names. Frozen since `Schema` returns its cached sets directly"""
 
 
 class FieldInfo(BaseModel):
-    """Field property information"""
+    """Field property information. Frozen, so instances can be shared and hashed"""
+
+    model_config = ConfigDict(frozen=True)
 
     ref: URIRef
     """Predicate reference. Used for serializing to rdf triples"""
@@ -213,7 +222,9 @@ class FieldInfo(BaseModel):
     def check_range_and_resource_ref(self) -> Self:
         """Validate range and resource_ref fields in FieldInfo
 
-        If `resource_ref` is not None, range must be either XSD.IDREF or None
+        If `resource_ref` is not None, range must be either XSD.IDREF or None, and is set to
+        XSD.IDREF if None. The instance is frozen, so range is written to `__dict__` directly -
+        a copy returned from here would be discarded when validating via `__init__`.
 
         Raises:
             ValueError: if `resource_ref` is provided and `range` is not XSD.IDREF
@@ -221,56 +232,105 @@ class FieldInfo(BaseModel):
         Returns:
             Self: instance
         """
-        if isinstance(self.resource_ref, _URIRef):
-            if not self.range or self.range == XSD.IDREF:
-                self.range = XSD.IDREF
-            else:
+        if self.resource_ref is not None:
+            if self.range is None:
+                self.__dict__["range"] = XSD.IDREF
+                self.__pydantic_fields_set__.add("range")
+            elif self.range != XSD.IDREF:
                 raise ValueError("If a resource reference is provided, range must be a None or XSD.IDREF")
         return self
 
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the field info, applying `update`.
+
+        Unlike `BaseModel.model_copy`, the copy is validated, so the range check above also applies
+        to updated fields. `deep` has no effect as field infos are immutable.
+        """
+        return self.model_validate({**dict(self), **(update or {})})
+
 
 class Schema(BaseModel):
     """Schema object that provides properties information for
     attributes of a `LinkedDataClass`.
+
+    Schemas are frozen and `attrs` is stored as a read-only mapping, so derived mappings
+    can be computed once and reused.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     rdf_resource: URIRef
     """Reference to rdf resource of the LinkedDataClass"""
-    attrs: dict[str, FieldInfo]
-    """Mapping between field name and field info"""
+    attrs: Mapping[str, FieldInfo]
+    """Mapping between field name and field info. Read-only"""
+
+    @field_validator("attrs", mode="after")
+    @classmethod
+    def freeze_attrs(cls, value: Mapping[str, FieldInfo]) -> Mapping[str, FieldInfo]:
+        """Store `attrs` as a read-only view of a private copy"""
+        return MappingProxyType(dict(value))
+
+    @field_serializer("attrs")
+    def serialize_attrs(self, value: Mapping[str, FieldInfo]) -> dict[str, FieldInfo]:
+        """Serialize `attrs` as a plain dict"""
+        return dict(value)
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the schema, applying `update`.
+
+        Unlike `BaseModel.model_copy`, the copy is validated, so cached mappings are rebuilt from
+        the new `attrs` instead of being carried over. `deep` has no effect as schemas are immutable.
+        """
+        return self.model_validate({**dict(self), **(update or {})})
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> Self:
+        return self
+
+    def __hash__(self) -> int:
+        return hash((self.rdf_resource, frozenset(self.attrs.items())))
+
+    def __getstate__(self) -> dict[Any, Any]:
+        """Pickle `attrs` as a plain dict, leaving out cached mappings"""
+        state = super().__getstate__()
+        return {**state, "__dict__": {"rdf_resource": self.rdf_resource, "attrs": dict(self.attrs)}}
+
+    def __setstate__(self, state: dict[Any, Any]) -> None:
+        """Restore `attrs` as a read-only mapping"""
+        fields = state["__dict__"]
+        super().__setstate__({**state, "__dict__": {**fields, "attrs": MappingProxyType(fields["attrs"])}})
 
     @property
-    def name_mapping(self) -> dict[str, FieldInfo]:
+    def name_mapping(self) -> Mapping[str, FieldInfo]:
         """Mapping from name to field information
 
         Returns:
-            dict[str, FieldInfo]: returned object
+            Mapping[str, FieldInfo]: returned object
         """
         return self.attrs
 
-    @property
-    def ref_mapping(self) -> dict[URIRef, str]:
-        """Mapping from field reference to field name
+    @cached_property
+    def ref_mapping(self) -> Mapping[URIRef, str]:
+        """Mapping from field reference to field name. Computed on first access
 
         Returns:
-            dict[URIRef, str]: returned object
+            Mapping[URIRef, str]: read-only mapping
         """
-        return {item.ref: name for name, item in self.attrs.items()}
+        return MappingProxyType({item.ref: name for name, item in self.attrs.items()})
 
-    @property
+    @cached_property
     def fields(self) -> FieldSetT:
-        """Get all attributes defined in the schema
+        """Get all attributes defined in the schema. Computed on first access
 
         Returns:
-            FieldSet: set of attributes defined in schema
+            FieldSetT: frozenset of attributes defined in schema
         """
-        return set(self.attrs.keys())
+        return frozenset(self.attrs.keys())
 
-    @property
+    @cached_property
     def required(self) -> FieldSetT:
-        """Get required fields from schema
+        """Get required fields from schema. Computed on first access
 
         Returns:
-            FieldSet: set of required fields in schema
+            FieldSetT: frozenset of required fields in schema
         """
-        return {k for k, v in self.attrs.items() if v.required}
+        return frozenset(k for k, v in self.attrs.items() if v.required)
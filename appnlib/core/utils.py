@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 from rdflib import BNode, IdentifiedNode, URIRef
@@ -9,6 +10,16 @@ __all__ = (
     "make_ref",
 )
 
+_MISSING = object()
+
+
+@lru_cache(maxsize=65536)
+def _ref_from_str(identifier: str) -> IdentifiedNode:
+    """Convert a string identifier to a `BNode` or `URIRef`"""
+    if identifier.startswith("_:"):
+        return BNode(identifier[2:])
+    return URIRef(identifier)
+
 
 def make_ref(identifier: IdentifiedNode | str | None = None) -> IdentifiedNode:
     """Create a Node reference
@@ -28,12 +39,15 @@ def make_ref(identifier: IdentifiedNode | str | None = None) -> IdentifiedNode:
     """
     if identifier is None:
         return BNode()
+    # Exact type checks first; subclasses fall through to isinstance below
+    if type(identifier) is str:
+        return _ref_from_str(identifier)
+    if type(identifier) is URIRef or type(identifier) is BNode:
+        return identifier
     if isinstance(identifier, IdentifiedNode):
         return identifier
     if isinstance(identifier, str):
-        if identifier.startswith("_:"):
-            return BNode(identifier[2:])
-        return URIRef(identifier)
+        return _ref_from_str(identifier)
     raise TypeError(f"Invalid type: {type(identifier)}")
 
 
@@ -53,10 +67,13 @@ def get_key_or_attribute(field: str, obj: Any, raise_error_if_missing: bool = Fa
     Returns:
         Any: the key/attribute value if they exist, or None if they don't and `raise_error_if_missing` is False
     """
-    if hasattr(obj, field):
-        return getattr(obj, field)
-    if isinstance(obj, dict) and field in obj:
-        return obj.get(field)
+    value = getattr(obj, field, _MISSING)
+    if value is not _MISSING:
+        return value
+    if isinstance(obj, dict):
+        value = obj.get(field, _MISSING)
+        if value is not _MISSING:
+            return value
     if raise_error_if_missing:
         raise KeyError(f"Object has no key: {field}")
     return None
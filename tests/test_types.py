@@ -0,0 +1,114 @@
+import copy
+import pickle
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from appnlib.core.types import FieldInfo, Schema
+from pydantic import ValidationError
+from rdflib import XSD, URIRef
+
+NAME = FieldInfo(ref=URIRef("http://example.org/name"))
+AGE = FieldInfo(ref=URIRef("http://example.org/age"), required=False)
+PERSON = URIRef("http://example.org/Person")
+KNOWS = URIRef("http://example.org/knows")
+
+
+def test_field_info_resource_ref_defaults_range_to_idref() -> None:
+    info = FieldInfo(ref=KNOWS, resource_ref=PERSON)
+    assert info.range == XSD.IDREF
+    assert "range" in info.model_fields_set
+
+
+def test_field_info_resource_ref_from_attributes() -> None:
+    source = SimpleNamespace(ref=KNOWS, range=None, resource_ref=PERSON, repeat=False, required=True)
+    assert FieldInfo.model_validate(source, from_attributes=True).range == XSD.IDREF
+
+
+@pytest.mark.parametrize("range_ref", [XSD.IDREF, str(XSD.IDREF)])
+def test_field_info_resource_ref_accepts_idref(range_ref: Any) -> None:
+    assert FieldInfo(ref=KNOWS, range=range_ref, resource_ref=PERSON).range == XSD.IDREF
+
+
+def test_field_info_resource_ref_rejects_other_range() -> None:
+    with pytest.raises(ValidationError):
+        FieldInfo(ref=KNOWS, range=XSD.string, resource_ref=PERSON)
+
+
+def test_field_info_copy_validates() -> None:
+    assert NAME.model_copy(update={"resource_ref": PERSON}).range == XSD.IDREF
+    with pytest.raises(ValidationError):
+        NAME.model_copy(update={"range": XSD.string, "resource_ref": PERSON})
+
+
+def test_field_info_frozen() -> None:
+    with pytest.raises(ValidationError):
+        NAME.range = XSD.string  # type: ignore[misc]
+
+
+def test_field_info_hashable_and_equal() -> None:
+    first = FieldInfo(ref=KNOWS, resource_ref=PERSON)
+    second = FieldInfo(ref=KNOWS, range=XSD.IDREF, resource_ref=PERSON)
+    assert first == second
+    assert hash(first) == hash(second)
+    assert len({first, second, NAME}) == 2
+
+
+@pytest.fixture
+def schema() -> Schema:
+    return Schema(rdf_resource=PERSON, attrs={"name": NAME, "age": AGE})
+
+
+def test_schema_mappings(schema: Schema) -> None:
+    assert schema.name_mapping == {"name": NAME, "age": AGE}
+    assert schema.ref_mapping == {NAME.ref: "name", AGE.ref: "age"}
+    assert schema.ref_mapping is schema.ref_mapping
+
+
+def test_schema_field_sets(schema: Schema) -> None:
+    assert schema.fields == frozenset(schema.attrs)
+    assert schema.required == frozenset({"name"})
+    assert schema.fields is schema.fields
+
+
+def test_schema_attrs_read_only(schema: Schema) -> None:
+    with pytest.raises(TypeError):
+        schema.attrs["height"] = NAME  # type: ignore[index]
+
+
+def test_schema_attrs_not_shared_with_input() -> None:
+    attrs = {"name": NAME}
+    schema = Schema(rdf_resource=PERSON, attrs=attrs)
+    attrs["age"] = AGE
+    assert schema.attrs == {"name": NAME}
+
+
+def test_schema_copy_rebuilds_mappings(schema: Schema) -> None:
+    assert schema.ref_mapping == {NAME.ref: "name", AGE.ref: "age"}
+    assert schema.fields == {"name", "age"}
+    copied = schema.model_copy(update={"attrs": {"age": AGE}})
+    assert copied.ref_mapping == {AGE.ref: "age"}
+    assert copied.fields == frozenset(copied.attrs) == {"age"}
+    assert copied.required == frozenset()
+    assert schema.ref_mapping == {NAME.ref: "name", AGE.ref: "age"}
+    assert schema.fields == {"name", "age"}
+
+
+def test_schema_hashable_and_equal(schema: Schema) -> None:
+    other = Schema(rdf_resource=PERSON, attrs={"name": NAME, "age": AGE})
+    assert schema == other
+    assert hash(schema) == hash(other)
+    assert copy.deepcopy(schema) == schema
+
+
+def test_schema_round_trip(schema: Schema) -> None:
+    assert Schema.model_validate_json(schema.model_dump_json()) == schema
+
+
+def test_schema_pickle_round_trip(schema: Schema) -> None:
+    assert schema.ref_mapping == {NAME.ref: "name", AGE.ref: "age"}
+    restored = pickle.loads(pickle.dumps(schema))
+    assert restored == schema
+    assert restored.ref_mapping == schema.ref_mapping
+    with pytest.raises(TypeError):
+        restored.attrs["height"] = NAME  # type: ignore[index]